@@ -1,6 +1,7 @@
 import os
 import subprocess
 import json
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import List
@@ -10,23 +11,42 @@ from .models import CameraFile
 
 logger = logging.getLogger(__name__)
 
+# GoPro clip extensions, matched case-insensitively
+GOPRO_VIDEO_EXTENSIONS = frozenset({'.mp4'})
+
+# Where GoPros get mounted: /media/ (typical Linux) and /tmp/ (EC2 simulation)
+GOPRO_MOUNT_ROOTS = ("/media", "/tmp")
+
+# path -> (checked_at, exists); mount points rarely change between requests
+_PATH_EXISTS_TTL = 2.0
+_path_exists_cache = {}
+
+def _path_exists(path: str) -> bool:
+    """os.path.exists with a short TTL cache"""
+    now = time.monotonic()
+    cached = _path_exists_cache.get(path)
+    if cached is not None and now - cached[0] < _PATH_EXISTS_TTL:
+        return cached[1]
+
+    exists = os.path.exists(path)
+    _path_exists_cache[path] = (now, exists)
+    return exists
+
 def detect_gopro_devices():
     """Detect GoPro cameras mounted as USB storage"""
-    # Check both /media/ (typical Linux) and /tmp/ (for EC2 simulation)
-    media_paths = [Path("/media"), Path("/tmp")]
     gopro_devices = []
 
-    for media_path in media_paths:
-        if not media_path.exists():
+    for media_path in GOPRO_MOUNT_ROOTS:
+        if not _path_exists(media_path):
             continue
 
-        for device in media_path.iterdir():
-            if device.is_dir():
-                # GoPros typically mount with DCIM folder structure
-                dcim_path = device / "DCIM"
-                if dcim_path.exists():
-                    gopro_devices.append(str(device))
-                    logger.info(f"Found GoPro device at {device}")
+        with os.scandir(media_path) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # GoPros typically mount with DCIM folder structure
+                    if _path_exists(os.path.join(entry.path, "DCIM")):
+                        gopro_devices.append(entry.path)
+                        logger.info(f"Found GoPro device at {entry.path}")
 
     return gopro_devices
 
@@ -39,7 +59,15 @@ def list_video_files(device_path: str) -> List[CameraFile]:
         logger.warning(f"DCIM folder not found in {device_path}")
         return videos
 
-    for video_file in dcim_path.rglob("*.MP4"):
+    # Single walk of DCIM, filtering names in memory
+    video_paths = [
+        Path(root) / name
+        for root, _, names in os.walk(dcim_path)
+        for name in names
+        if os.path.splitext(name)[1].lower() in GOPRO_VIDEO_EXTENSIONS
+    ]
+
+    for video_file in video_paths:
         try:
             metadata = get_video_metadata(str(video_file))
             video_info = CameraFile(
@@ -2,6 +2,7 @@
 Input Video Scanner for /input directory
 Scans for angle videos: FR (Far Right), FL (Far Left), NL (Near Left), NR (Near Right)
 """
+import os
 import re
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -20,6 +21,13 @@ ANGLE_PATTERNS = {
     'NR': 'nearright'
 }
 
+# Supported input video extensions (lowercase)
+VIDEO_EXTENSIONS = frozenset({'.m4v', '.mp4', '.mov'})
+
+# Pattern: MM-DD ANGLE[_anything].ext or MM-D ANGLE[_anything].ext
+# Supports: "10-2 FR.m4v", "10-2 FL_test.mp4", "10-02 NR_backup.mov"
+FILENAME_PATTERN = re.compile(r'(\d{1,2})-(\d{1,2})\s+(FR|FL|NL|NR)(?:_\w+)?\.(m4v|mp4|mov)', re.IGNORECASE)
+
 class InputVideo:
     """Represents a video file from /input directory"""
     def __init__(self, path: str, date: str, angle_short: str, angle_full: str):
@@ -63,11 +71,7 @@ def parse_filename(filename: str) -> Optional[Dict[str, str]]:
     Returns:
         Dict with 'date' and 'angle' or None if pattern doesn't match
     """
-    # Pattern: MM-DD ANGLE[_anything].ext or MM-D ANGLE[_anything].ext
-    # Supports: "10-2 FR.m4v", "10-2 FL_test.mp4", "10-02 NR_backup.mov"
-    pattern = r'(\d{1,2})-(\d{1,2})\s+(FR|FL|NL|NR)(?:_\w+)?\.(m4v|mp4|mov)'
-
-    match = re.match(pattern, filename, re.IGNORECASE)
+    match = FILENAME_PATTERN.match(filename)
     if match:
         month = match.group(1).zfill(2)  # Pad to 2 digits
         day = match.group(2).zfill(2)
@@ -95,15 +99,20 @@ def scan_input_directory(input_dir: str = "input") -> List[InputVideo]:
 
     videos = []
 
-    # Scan for video files
-    for video_file in input_path.glob("*"):
+    # Scan for video files (single directory read, no per-pattern globbing)
+    with os.scandir(input_path) as entries:
+        files = [entry for entry in entries if entry.is_file()]
+
+    for entry in files:
+        video_file = Path(entry.path)
+
         # Skip .crdownload (downloading files) and hidden files
         if video_file.suffix == '.crdownload' or video_file.name.startswith('.'):
             logger.info(f"Skipping incomplete/hidden file: {video_file.name}")
             continue
 
         # Only process video files
-        if video_file.suffix.lower() not in ['.m4v', '.mp4', '.mov']:
+        if video_file.suffix.lower() not in VIDEO_EXTENSIONS:
             continue
 
         # Parse filename
@@ -127,7 +136,7 @@ def scan_input_directory(input_dir: str = "input") -> List[InputVideo]:
 
         # Get file size
         try:
-            video.size = video_file.stat().st_size
+            video.size = entry.stat().st_size
         except Exception as e:
             logger.error(f"Error getting file size for {video_file}: {e}")
             continue
@@ -161,8 +170,15 @@ def get_videos_by_date(input_dir: str = "input") -> Dict[str, List[InputVideo]]:
         Dict mapping date -> List[InputVideo]
         Example: {"10-02": [FR_video, FL_video, NL_video, NR_video]}
     """
-    videos = scan_input_directory(input_dir)
+    return group_videos_by_date(scan_input_directory(input_dir))
 
+def group_videos_by_date(videos: List[InputVideo]) -> Dict[str, List[InputVideo]]:
+    """
+    Group already-scanned videos by date
+
+    Returns:
+        Dict mapping date -> List[InputVideo]
+    """
     grouped = {}
     for video in videos:
         if video.date not in grouped:
@@ -1,11 +1,27 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from pathlib import Path
 
+# Background listener that drains the log queue into the real handlers
+_queue_listener = None
+
+def _stop_queue_listener():
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+atexit.register(_stop_queue_listener)
+
 def setup_logging(log_dir: str = "logs", log_level: str = "INFO"):
     """
-    Setup centralized logging with rotation
+    Setup centralized logging with rotation.
+
+    Callers only enqueue records; file and console writes happen on a
+    QueueListener thread so logging never blocks the event loop on disk I/O.
     """
     # Create log directory if it doesn't exist
     log_path = Path(log_dir)
@@ -35,11 +51,20 @@ def setup_logging(log_dir: str = "logs", log_level: str = "INFO"):
         backupCount=5
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
     
     # Console Handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+
+    # Route records through a queue to a background listener thread
+    _stop_queue_listener()
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    global _queue_listener
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     logging.info(f"Logging initialized in {log_dir} at level {log_level}")
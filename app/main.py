@@ -1,14 +1,18 @@
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse, Response
+from fastapi.responses import HTMLResponse, FileResponse, StreamingResponse, Response, ORJSONResponse
 import json
+import orjson
 import asyncio
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
+from collections import Counter
 import time
 import os
+import hashlib
+import gzip
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -18,9 +22,9 @@ from .models import Game, TimeRange, Config, AngleMapping, ProcessingStatus
 from .camera_detection import detect_gopro_devices, get_all_camera_files
 from .config import load_config, save_config, update_side, update_aws_config
 from .utils import generate_game_uuid, validate_time_range, cleanup_temp_files
-from .video_processor import extract_segment, get_resolution, is_4k_or_higher, compress_video
-from .s3_uploader import upload_to_s3, validate_aws_credentials
-from .input_video_scanner import scan_input_directory, get_videos_by_date, validate_date_videos
+from .video_processor import extract_segment, get_resolution_async, is_4k_or_higher, compress_video
+from .s3_uploader import upload_to_s3, validate_aws_credentials, close_uploaders
+from .input_video_scanner import scan_input_directory, group_videos_by_date, validate_date_videos
 from .parallel_processor import ParallelProcessor, GameJob, ResourceManager
 from .audio_sync import synchronize_videos, AudioSyncError
 
@@ -30,7 +34,11 @@ from .logging_config import setup_logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Basketball Video Processing Pipeline", version="1.0.0")
+app = FastAPI(
+    title="Basketball Video Processing Pipeline",
+    version="1.0.0",
+    default_response_class=ORJSONResponse
+)
 
 # Global state
 games: Dict[str, Game] = {}
@@ -40,6 +48,22 @@ processing_active = False
 input_video_jobs: Dict[str, GameJob] = {}  # game_id -> GameJob
 input_processing_active = False
 
+# Strong references to running background tasks (the event loop only keeps
+# weak ones, so an unreferenced task can be garbage-collected mid-run)
+_background_tasks = set()
+
+def start_background_task(coro) -> asyncio.Task:
+    """Run a coroutine in the background on the current event loop"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+@app.on_event("shutdown")
+async def close_s3_uploaders():
+    """Stop the shared S3 transfer threads (in-flight uploads finish first)"""
+    await asyncio.to_thread(close_uploaders)
+
 # Video scan cache (to avoid re-scanning on every video stream request)
 _video_scan_cache = {
     'videos': None,
@@ -75,7 +99,7 @@ class ProgressTracker:
         self.active_connections.append(websocket)
         # Send current status immediately
         if self.current_status:
-            await websocket.send_text(json.dumps(self.current_status))
+            await websocket.send_text(orjson.dumps(self.current_status).decode())
 
     def disconnect(self, websocket: WebSocket):
         if websocket in self.active_connections:
@@ -85,9 +109,12 @@ class ProgressTracker:
         self.current_status = message
         disconnected = []
 
+        # Serialize once for all clients
+        payload = orjson.dumps(message).decode()
+
         for connection in self.active_connections:
             try:
-                await connection.send_text(json.dumps(message))
+                await connection.send_text(payload)
             except:
                 disconnected.append(connection)
 
@@ -101,14 +128,58 @@ progress_tracker = ProgressTracker()
 # Mount static files
 app.mount("/static", StaticFiles(directory="app/static"), name="static")
 
+def _load_page(path: str):
+    """Read an HTML page once, compute its ETag and gzip it"""
+    body = Path(path).read_bytes()
+    # Compressed once at startup, so the slowest/smallest level is free
+    return body, f'"{hashlib.md5(body).hexdigest()}"', gzip.compress(body, compresslevel=9)
+
+# HTML pages have no server-side variables, so serve precomputed bytes
+_INDEX_PAGE = _load_page('app/static/index.html')
+_INPUT_VIDEOS_PAGE = _load_page('app/static/input-videos.html')
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values"""
+    qvalues = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.partition(';')
+        q = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    if 'gzip' in qvalues:
+        return qvalues['gzip'] > 0
+    return qvalues.get('*', 0) > 0
+
+def _page_response(request: Request, page) -> Response:
+    """Serve a precomputed page, answering 304 when the browser copy is current"""
+    body, etag, gzipped = page
+    use_gzip = _accepts_gzip(request.headers.get('accept-encoding', ''))
+    if use_gzip:
+        # Each encoding is a different representation, so it needs its own ETag
+        etag = f'{etag[:-1]}-gz"'
+    # no-cache: browsers keep the page but revalidate it (cheap 304) each load
+    headers = {'ETag': etag, 'Cache-Control': 'no-cache', 'Vary': 'Accept-Encoding'}
+    if etag in [tag.strip() for tag in request.headers.get('if-none-match', '').split(',')]:
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers['Content-Encoding'] = 'gzip'
+        body = gzipped
+    return Response(content=body, media_type='text/html', headers=headers)
+
 @app.get("/")
-async def read_root():
-    return FileResponse('app/static/index.html')
+async def read_root(request: Request):
+    return _page_response(request, _INDEX_PAGE)
 
 @app.get("/input-videos")
-async def input_videos_page():
+async def input_videos_page(request: Request):
     """Serve the input videos workflow UI"""
-    return FileResponse('app/static/input-videos.html')
+    return _page_response(request, _INPUT_VIDEOS_PAGE)
 
 @app.get("/api/config")
 async def get_config():
@@ -198,12 +269,19 @@ async def create_game(request: dict):
         games[uuid] = game
 
         logger.info(f"Created game {uuid} ({time_range.start} - {time_range.end})")
-        return game.dict()
 
     except Exception as e:
         logger.error(f"Error creating game: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
+    # Other open clients refresh their game list on game-level messages
+    await progress_tracker.broadcast({
+        "game_uuid": uuid,
+        "stage": "created",
+        "message": f"Game {uuid} created"
+    })
+    return game.dict()
+
 @app.delete("/api/games/{uuid}")
 async def delete_game(uuid: str):
     """Delete game"""
@@ -215,6 +293,12 @@ async def delete_game(uuid: str):
 
     del games[uuid]
     logger.info(f"Deleted game {uuid}")
+
+    await progress_tracker.broadcast({
+        "game_uuid": uuid,
+        "stage": "deleted",
+        "message": f"Game {uuid} deleted"
+    })
     return {"success": True}
 
 @app.post("/api/process/start")
@@ -245,7 +329,7 @@ async def start_processing():
 
     # Start processing in background
     processing_active = True
-    asyncio.create_task(process_all_games(pending_games, camera_files, config))
+    start_background_task(process_all_games(pending_games, camera_files, config))
 
     logger.info(f"Started processing {len(pending_games)} games")
     return {"success": True, "games_count": len(pending_games)}
@@ -253,19 +337,16 @@ async def start_processing():
 @app.get("/api/process/status")
 async def get_processing_status():
     """Get overall processing status"""
-    total_games = len(games)
-    completed = len([g for g in games.values() if g.status == "complete"])
-    in_progress = len([g for g in games.values() if g.status == "processing"])
-    pending = len([g for g in games.values() if g.status == "pending"])
-    error = len([g for g in games.values() if g.status == "error"])
+    # One pass over a single snapshot so the counts always add up
+    counts = Counter(g.status for g in games.values())
 
     return {
         "processing_active": processing_active,
-        "total_games": total_games,
-        "completed": completed,
-        "in_progress": in_progress,
-        "pending": pending,
-        "error": error
+        "total_games": sum(counts.values()),
+        "completed": counts["complete"],
+        "in_progress": counts["processing"],
+        "pending": counts["pending"],
+        "error": counts["error"]
     }
 
 @app.websocket("/ws/progress")
@@ -297,6 +378,12 @@ async def process_all_games(games_list: List[Game], camera_files: List, config:
                 game.status = "complete"
                 logger.info(f"Completed game {game.uuid}")
 
+                await progress_tracker.broadcast({
+                    "message": f"Completed game {game.uuid}",
+                    "game_uuid": game.uuid,
+                    "stage": "complete"
+                })
+
             except Exception as e:
                 game.status = "error"
                 game.error_message = str(e)
@@ -357,7 +444,7 @@ async def process_single_angle(game: Game, camera_file: str, angle: str, config:
 
         # Step 2: Check resolution - CRITICAL CHECK
         logger.info(f"Checking resolution for {game.uuid} - {angle}")
-        width, height = get_resolution(str(segment_path))
+        width, height = await get_resolution_async(str(segment_path))
 
         if width is None or height is None:
             raise ValueError(f"Could not determine resolution for {segment_path}")
@@ -421,8 +508,17 @@ async def process_single_angle(game: Game, camera_file: str, angle: str, config:
             "progress": 0.7
         })
 
+        # Upload fills the 0.7 -> 1.0 range of the progress bar
+        async def upload_progress(bytes_sent: int, total_bytes: int):
+            await progress_tracker.broadcast({
+                "game_uuid": game.uuid,
+                "angle": angle,
+                "stage": "uploading",
+                "progress": 0.7 + 0.3 * bytes_sent / max(total_bytes, 1)
+            })
+
         s3_key = f"{game.uuid}/{angle}/video.mp4"
-        await upload_to_s3(str(final_path), s3_key, config)
+        await upload_to_s3(str(final_path), s3_key, config, progress_callback=upload_progress)
 
         # Step 5: Cleanup
         final_path.unlink()
@@ -466,7 +562,7 @@ async def scan_input_videos(force_refresh: bool = False):
         if force_refresh:
             invalidate_video_cache()
 
-        videos_by_date = get_videos_by_date("input")
+        videos_by_date = group_videos_by_date(get_cached_videos())
 
         # Add validation info for each date
         result = {}
@@ -843,7 +939,7 @@ async def create_input_job(request: dict):
             )
 
         # Get videos for this date
-        videos_by_date = get_videos_by_date("input")
+        videos_by_date = group_videos_by_date(get_cached_videos())
 
         if date not in videos_by_date:
             raise HTTPException(
@@ -942,7 +1038,7 @@ async def process_input_videos():
 
     # Start processing in background
     input_processing_active = True
-    asyncio.create_task(process_input_jobs_parallel(pending_jobs, config))
+    start_background_task(process_input_jobs_parallel(pending_jobs, config))
 
     logger.info(f"Started parallel processing of {len(pending_jobs)} input video jobs")
 
@@ -955,19 +1051,16 @@ async def process_input_videos():
 @app.get("/api/input-videos/status")
 async def get_input_processing_status():
     """Get overall input video processing status"""
-    total_jobs = len(input_video_jobs)
-    completed = len([j for j in input_video_jobs.values() if j.status == "completed"])
-    in_progress = len([j for j in input_video_jobs.values() if j.status == "processing"])
-    pending = len([j for j in input_video_jobs.values() if j.status == "pending"])
-    error = len([j for j in input_video_jobs.values() if j.status == "error"])
+    # One pass over a single snapshot so the counts always add up
+    counts = Counter(j.status for j in input_video_jobs.values())
 
     return {
         "processing_active": input_processing_active,
-        "total_jobs": total_jobs,
-        "completed": completed,
-        "in_progress": in_progress,
-        "pending": pending,
-        "error": error,
+        "total_jobs": sum(counts.values()),
+        "completed": counts["completed"],
+        "in_progress": counts["processing"],
+        "pending": counts["pending"],
+        "error": counts["error"],
         "max_concurrent": ResourceManager.get_max_concurrent_ffmpeg()
     }
 
@@ -1011,9 +1104,12 @@ async def health_check():
     from .video_processor import check_gpu_available
     import shutil
 
+    # nvidia-smi is a blocking subprocess, run it off the event loop
+    gpu_available = await asyncio.to_thread(check_gpu_available)
+
     return {
         "status": "healthy",
-        "gpu_available": check_gpu_available(),
+        "gpu_available": gpu_available,
         "disk_space_gb": shutil.disk_usage("/").free / (1024**3),
         "active_connections": len(progress_tracker.active_connections),
         "processing_active": processing_active,
@@ -1,6 +1,11 @@
 from pydantic import BaseModel, validator
 from datetime import datetime
 from typing import List, Optional, Literal
+import re
+
+# "HH:MM:SS" (same 1-2 digit fields and ranges strptime's %H:%M:%S accepts).
+# Use fullmatch: unlike $, it rejects a trailing newline, as strptime does.
+TIME_PATTERN = re.compile(r'([01]?\d|2[0-3]):[0-5]?\d:[0-5]?\d')
 
 class TimeRange(BaseModel):
     start: str  # Format: "HH:MM:SS"
@@ -8,11 +13,9 @@ class TimeRange(BaseModel):
 
     @validator('start', 'end')
     def validate_time_format(cls, v):
-        try:
-            datetime.strptime(v, "%H:%M:%S")
-            return v
-        except ValueError:
+        if not TIME_PATTERN.fullmatch(v):
             raise ValueError("Time must be in HH:MM:SS format")
+        return v
 
 class Game(BaseModel):
     uuid: str
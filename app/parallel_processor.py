@@ -9,9 +9,10 @@ from pathlib import Path
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
+from urllib.parse import quote
 
-from .video_processor import extract_segment, is_4k_or_higher, compress_video, get_resolution
-from .s3_uploader import upload_to_s3
+from .video_processor import extract_segment, is_4k_or_higher, compress_video, get_resolution_async
+from .s3_uploader import upload_to_s3, s3_object_matches, MAX_CONCURRENT_UPLOADS
 from .models import Config
 
 logger = logging.getLogger(__name__)
@@ -48,6 +49,21 @@ class ResourceManager:
         except:
             return False
 
+    @staticmethod
+    def is_rotational_disk(path: str = ".") -> bool:
+        """Check if path lives on a spinning disk (Linux sysfs; False if unknown)"""
+        try:
+            dev = os.stat(path).st_dev
+            block = Path(f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}").resolve()
+            # Partitions keep the queue settings on their parent device
+            for device in (block, block.parent):
+                flag = device / "queue" / "rotational"
+                if flag.exists():
+                    return flag.read_text().strip() == "1"
+        except OSError:
+            pass
+        return False
+
     @staticmethod
     def get_max_concurrent_ffmpeg() -> int:
         """
@@ -59,8 +75,11 @@ class ResourceManager:
         cpu_count = ResourceManager.get_cpu_count()
         available_mem_gb = ResourceManager.get_available_memory_gb()
         has_gpu = ResourceManager.check_gpu_available()
+        # Segments are written under ./temp
+        rotational = ResourceManager.is_rotational_disk()
 
-        logger.info(f"System resources: {cpu_count} CPUs, {available_mem_gb:.1f}GB RAM, GPU: {has_gpu}")
+        logger.info(f"System resources: {cpu_count} CPUs, {available_mem_gb:.1f}GB RAM, GPU: {has_gpu}, "
+                    f"rotational disk: {rotational}")
 
         # Conservative calculation
         # Each FFmpeg process needs ~2GB RAM for 4K compression
@@ -79,6 +98,10 @@ class ResourceManager:
             # CPU encoding is much heavier
             recommended = min(mem_based_limit, cpu_based_limit)
 
+        # Parallel segment reads/writes seek-thrash a spinning disk
+        if rotational:
+            recommended = min(recommended, 2)
+
         # Ensure at least 1, at most 4 for stability on edge devices
         recommended = max(1, min(recommended, 4))
 
@@ -118,6 +141,19 @@ class GameJob:
         for angle in video_files.keys():
             self.angle_status[angle] = "pending"
 
+    def upload_metadata(self, video_path: str) -> Dict[str, str]:
+        """
+        S3 metadata identifying the source file and cut an angle was made
+        from, so a re-run can tell the uploaded object is still current
+        """
+        stat = os.stat(video_path)
+        # S3 user metadata must be ASCII; filenames may not be
+        name = quote(Path(video_path).name)
+        return {
+            'source': f"{name}:{stat.st_size}:{stat.st_mtime_ns}",
+            'cut': f"{self.time_start}-{self.time_end}"
+        }
+
     def to_dict(self):
         return {
             'game_id': self.game_id,
@@ -151,6 +187,12 @@ class ParallelProcessor:
 
         # Semaphore to control concurrency
         self.semaphore = asyncio.Semaphore(self.max_concurrent)
+        # Uploads are network-bound, so they get their own limit instead of
+        # sharing the FFmpeg semaphore
+        self.upload_semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
+        # Segments are multi-GB: cap how many sit in temp/ at once (being
+        # cut/compressed, or waiting on/undergoing upload)
+        self.staging_semaphore = asyncio.Semaphore(self.max_concurrent + MAX_CONCURRENT_UPLOADS)
 
         # Progress callback
         self.progress_callback = progress_callback
@@ -198,11 +240,15 @@ class ParallelProcessor:
             # Process all angles (semaphore controls actual concurrency)
             results = await asyncio.gather(*angle_tasks, return_exceptions=True)
 
-            # Check if any failed
-            failures = [r for r in results if isinstance(r, Exception)]
+            # Check if any failed (results come back in video_files order)
+            failures = [
+                angle_full
+                for angle_full, result in zip(job.video_files, results)
+                if isinstance(result, Exception)
+            ]
             if failures:
                 job.status = "error"
-                job.error_message = f"{len(failures)} angles failed"
+                job.error_message = f"{len(failures)} angles failed: {', '.join(failures)}"
                 self.failed_jobs += 1
                 logger.error(f"Game {job.game_id} failed: {job.error_message}")
             else:
@@ -228,91 +274,113 @@ class ParallelProcessor:
             angle_full: Angle name (farright, farleft, nearleft, nearright)
             video_path: Path to source video file
         """
-        # Acquire semaphore (blocks if max concurrent reached)
-        async with self.semaphore:
-            try:
-                job.angle_status[angle_full] = "processing"
-                await self._broadcast_progress(job, "angle_started", angle=angle_full)
-
-                # Create temp directories
-                temp_dir = Path("temp")
-                segments_dir = temp_dir / "segments"
-                compressed_dir = temp_dir / "compressed"
-                segments_dir.mkdir(parents=True, exist_ok=True)
-                compressed_dir.mkdir(parents=True, exist_ok=True)
-
-                # Step 1: Extract segment (fast, copy codec)
-                segment_filename = f"{job.game_id}_{angle_full}_segment.mp4"
-                segment_path = segments_dir / segment_filename
-
-                logger.info(f"[{job.game_id}][{angle_full}] Extracting segment...")
-                await self._broadcast_progress(job, "extracting", angle=angle_full)
+        try:
+            # S3 key: Games/10-02/Game-1/10-02_game1_farright.mp4
+            s3_key = f"Games/{job.s3_prefix}/{job.game_id}_{angle_full}.mp4"
+            metadata = job.upload_metadata(video_path)
 
-                await extract_segment(
-                    video_path,
-                    str(segment_path),
-                    job.time_start,
-                    job.time_end
-                )
+            # Re-running a job skips angles already uploaded from the same cut
+            if await self._already_uploaded(s3_key, metadata):
+                job.angle_status[angle_full] = "completed"
+                logger.info(f"[{job.game_id}][{angle_full}] Already in S3 - skipping")
+                await self._broadcast_progress(job, "angle_completed", angle=angle_full)
+                return
+
+            # Hold a staging slot from extraction until the local file is
+            # deleted, so finished segments waiting on an upload slot can't
+            # pile up on disk
+            async with self.staging_semaphore:
+                # Acquire semaphore (blocks if max concurrent reached); it only
+                # guards the FFmpeg steps, so uploads don't hold an FFmpeg slot
+                async with self.semaphore:
+                    job.angle_status[angle_full] = "processing"
+                    await self._broadcast_progress(job, "angle_started", angle=angle_full)
+
+                    # Create temp directories
+                    temp_dir = Path("temp")
+                    segments_dir = temp_dir / "segments"
+                    compressed_dir = temp_dir / "compressed"
+                    segments_dir.mkdir(parents=True, exist_ok=True)
+                    compressed_dir.mkdir(parents=True, exist_ok=True)
+
+                    # Step 1: Extract segment (fast, copy codec)
+                    segment_filename = f"{job.game_id}_{angle_full}_segment.mp4"
+                    segment_path = segments_dir / segment_filename
+
+                    logger.info(f"[{job.game_id}][{angle_full}] Extracting segment...")
+                    await self._broadcast_progress(job, "extracting", angle=angle_full)
+
+                    await extract_segment(
+                        video_path,
+                        str(segment_path),
+                        job.time_start,
+                        job.time_end
+                    )
 
-                # Step 2: Check resolution
-                logger.info(f"[{job.game_id}][{angle_full}] Checking resolution...")
-                width, height = get_resolution(str(segment_path))
+                    # Step 2: Check resolution
+                    logger.info(f"[{job.game_id}][{angle_full}] Checking resolution...")
+                    width, height = await get_resolution_async(str(segment_path))
 
-                if width is None or height is None:
-                    raise ValueError(f"Could not determine resolution for {segment_path}")
+                    if width is None or height is None:
+                        raise ValueError(f"Could not determine resolution for {segment_path}")
 
-                logger.info(f"[{job.game_id}][{angle_full}] Resolution: {width}x{height}")
+                    logger.info(f"[{job.game_id}][{angle_full}] Resolution: {width}x{height}")
 
-                # Step 3: Compress if 4K
-                if is_4k_or_higher(width, height):
-                    logger.info(f"[{job.game_id}][{angle_full}] Video is 4K - compressing to 1080p...")
-                    await self._broadcast_progress(job, "compressing", angle=angle_full)
+                    # Step 3: Compress if 4K
+                    if is_4k_or_higher(width, height):
+                        logger.info(f"[{job.game_id}][{angle_full}] Video is 4K - compressing to 1080p...")
+                        await self._broadcast_progress(job, "compressing", angle=angle_full)
 
-                    compressed_filename = f"{job.game_id}_{angle_full}.mp4"
-                    compressed_path = compressed_dir / compressed_filename
+                        compressed_filename = f"{job.game_id}_{angle_full}.mp4"
+                        compressed_path = compressed_dir / compressed_filename
 
-                    await compress_video(
-                        str(segment_path),
-                        str(compressed_path),
-                        use_gpu=self.config.gpu_available
-                    )
+                        await compress_video(
+                            str(segment_path),
+                            str(compressed_path),
+                            use_gpu=self.config.gpu_available
+                        )
 
-                    # Use compressed file
-                    final_path = compressed_path
+                        # Use compressed file
+                        final_path = compressed_path
 
-                    # Delete segment to save space
-                    segment_path.unlink()
+                        # Delete segment to save space
+                        segment_path.unlink()
 
-                else:
-                    logger.info(f"[{job.game_id}][{angle_full}] Video is {width}x{height} - no compression needed")
-                    await self._broadcast_progress(job, "skipping_compression", angle=angle_full)
+                    else:
+                        logger.info(f"[{job.game_id}][{angle_full}] Video is {width}x{height} - no compression needed")
+                        await self._broadcast_progress(job, "skipping_compression", angle=angle_full)
 
-                    # Use original segment
-                    final_path = segment_path
+                        # Use original segment
+                        final_path = segment_path
 
                 # Step 4: Upload to S3
                 logger.info(f"[{job.game_id}][{angle_full}] Uploading to S3...")
                 await self._broadcast_progress(job, "uploading", angle=angle_full)
 
-                # S3 key: 10-02/Game-1/10-02_game1_farright.mp4
-                s3_key = f"{job.s3_prefix}/{job.game_id}_{angle_full}.mp4"
-
                 # Use configured bucket
-                await upload_to_s3(str(final_path), f"Games/{s3_key}", self.config)
+                async with self.upload_semaphore:
+                    await upload_to_s3(str(final_path), s3_key, self.config, metadata=metadata)
 
                 # Step 5: Cleanup
                 final_path.unlink()
 
-                job.angle_status[angle_full] = "completed"
-                logger.info(f"[{job.game_id}][{angle_full}] Completed successfully")
-                await self._broadcast_progress(job, "angle_completed", angle=angle_full)
+            job.angle_status[angle_full] = "completed"
+            logger.info(f"[{job.game_id}][{angle_full}] Completed successfully")
+            await self._broadcast_progress(job, "angle_completed", angle=angle_full)
 
-            except Exception as e:
-                job.angle_status[angle_full] = "error"
-                logger.error(f"[{job.game_id}][{angle_full}] Error: {e}")
-                await self._broadcast_progress(job, "angle_error", angle=angle_full, error=str(e))
-                raise
+        except Exception as e:
+            job.angle_status[angle_full] = "error"
+            logger.error(f"[{job.game_id}][{angle_full}] Error: {e}")
+            await self._broadcast_progress(job, "angle_error", angle=angle_full, error=str(e))
+            raise
+
+    async def _already_uploaded(self, s3_key: str, metadata: Dict[str, str]) -> bool:
+        """Check S3 for an upload of this exact cut; any lookup error means no"""
+        try:
+            return await s3_object_matches(s3_key, metadata, self.config)
+        except Exception as e:
+            logger.warning(f"Could not check s3 object {s3_key}: {e}")
+            return False
 
     async def _broadcast_progress(self, job: GameJob, stage: str, angle: Optional[str] = None, error: Optional[str] = None):
         """Broadcast progress update via callback"""
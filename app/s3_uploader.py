@@ -1,16 +1,76 @@
 import boto3
+import http.client
+import urllib3.connection
+from boto3.s3.transfer import ProgressCallbackInvoker, TransferConfig, create_transfer_manager
+from botocore.compat import HAS_CRT
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError
 import asyncio
+import threading
+import time
 from pathlib import Path
 import logging
-from typing import Optional
+from typing import Awaitable, Callable, Dict, Optional
 from .models import Config
 
 logger = logging.getLogger(__name__)
 
+# Multipart tuning for multi-GB game segments: larger parts and more
+# concurrent part uploads keep the uplink saturated. Anything bigger than
+# one part goes multipart so its parts upload in parallel; s3transfer
+# grows the part size further if a file would exceed 10,000 parts.
+MULTIPART_CHUNKSIZE = 64 * 1024 * 1024
+MULTIPART_THRESHOLD = MULTIPART_CHUNKSIZE
+MAX_CONCURRENCY = 16
+
+# Files uploaded at once (network-bound, so bounded separately from FFmpeg)
+MAX_CONCURRENT_UPLOADS = 4
+
+# Let S3 validate uploads with a CRC checksum instead of a client-side MD5.
+# CRC32C needs awscrt (boto3[crt]), which uses the hardware CRC32
+# instructions (SSE4.2 / ARMv8); fall back to zlib's CRC32 without it.
+UPLOAD_EXTRA_ARGS = {'ChecksumAlgorithm': 'CRC32C' if HAS_CRT else 'CRC32'}
+
+# Standard retry mode (exponential backoff + retry quota) for flaky uplinks,
+# and a pooled connection for every part of every concurrent upload
+CLIENT_CONFIG = BotoConfig(
+    retries={'mode': 'standard', 'max_attempts': 10},
+    max_pool_connections=MAX_CONCURRENT_UPLOADS * MAX_CONCURRENCY,
+    tcp_keepalive=True
+)
+
+# Bytes handed to each socket write while streaming a part body. The
+# http.client / urllib3 defaults (8-16 KiB) mean thousands of small writes,
+# each retaking the GIL, for every 64MB part.
+SOCKET_WRITE_BLOCKSIZE = 1024 * 1024
+
+
+def _raise_socket_write_blocksize(blocksize: int) -> None:
+    """Raise the default send block size of the connections botocore opens"""
+    for cls in (urllib3.connection.HTTPConnection, urllib3.connection.HTTPSConnection):
+        kwdefaults = cls.__init__.__kwdefaults__
+        if kwdefaults and 'blocksize' in kwdefaults:
+            kwdefaults['blocksize'] = blocksize
+    # urllib3 1.x leaves the block size to http.client
+    http.client.HTTPConnection.__init__.__defaults__ = tuple(
+        blocksize if default == 8192 else default
+        for default in http.client.HTTPConnection.__init__.__defaults__
+    )
+
+
+_raise_socket_write_blocksize(SOCKET_WRITE_BLOCKSIZE)
+
+# Minimum seconds between byte-level progress reports during an upload
+PROGRESS_INTERVAL = 1.0
+
+# async callback(bytes_sent, total_bytes)
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
 class S3Uploader:
     _client = None
     _client_config_hash = None
+    # (client config hash, bucket) pairs that already passed head_bucket
+    _verified_buckets = set()
 
     def __init__(self, config: Config):
         self.config = config
@@ -25,88 +85,123 @@ class S3Uploader:
                 's3',
                 aws_access_key_id=config.aws_access_key,
                 aws_secret_access_key=config.aws_secret_key,
-                region_name=config.s3_region
+                region_name=config.s3_region,
+                config=CLIENT_CONFIG
             )
             S3Uploader._client_config_hash = current_hash
             
         self.s3_client = S3Uploader._client
+        self._client_hash = current_hash
 
-    async def upload_file(self, file_path: str, s3_key: str, max_retries: int = 3) -> bool:
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            # Part threads are shared by all concurrent uploads
+            max_concurrency=MAX_CONCURRENT_UPLOADS * MAX_CONCURRENCY,
+            use_threads=True,
+            # The default ('auto') may pick the CRT transfer manager, which
+            # ignores the part size and concurrency tuned above
+            preferred_transfer_client='classic'
+        )
+
+        # One long-lived transfer manager instead of the fresh S3Transfer and
+        # thread pool client.upload_file builds (and tears down) per call
+        self._transfer_manager = create_transfer_manager(self.s3_client, self._transfer_config)
+
+    async def upload_file(self, file_path: str, s3_key: str, max_retries: int = 3,
+                          progress_callback: Optional[ProgressCallback] = None,
+                          metadata: Optional[Dict[str, str]] = None) -> bool:
         """Upload file to S3 with retry logic"""
         file_size = Path(file_path).stat().st_size
         logger.info(f"Uploading {file_path} ({file_size / (1024*1024):.1f} MB) to s3://{self.bucket}/{s3_key}")
 
-        # Use multipart upload for files > 100MB
-        if file_size > 100 * 1024 * 1024:
-            return await self._multipart_upload(file_path, s3_key, max_retries)
-        else:
-            return await self._simple_upload(file_path, s3_key, max_retries)
+        extra_args = UPLOAD_EXTRA_ARGS
+        if metadata:
+            extra_args = {**UPLOAD_EXTRA_ARGS, 'Metadata': metadata}
 
-    async def _simple_upload(self, file_path: str, s3_key: str, max_retries: int) -> bool:
-        """Simple upload for smaller files"""
-        for attempt in range(max_retries):
-            try:
-                # Run in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    self.s3_client.upload_file,
-                    file_path,
-                    self.bucket,
-                    s3_key
-                )
-                logger.info(f"Successfully uploaded {s3_key}")
-                return True
-            except ClientError as e:
-                logger.error(f"Upload attempt {attempt + 1} failed: {e}")
-                if attempt == max_retries - 1:
-                    raise
-                await asyncio.sleep(2 ** attempt)  # Exponential backoff
-
-        return False
+        return await self._upload_with_retry(file_path, s3_key, max_retries, file_size, progress_callback, extra_args)
 
-    async def _multipart_upload(self, file_path: str, s3_key: str, max_retries: int) -> bool:
-        """Multipart upload for large files"""
-        from boto3.s3.transfer import TransferConfig
+    async def object_metadata(self, s3_key: str) -> Optional[Dict[str, str]]:
+        """User metadata of an existing object, or None if it doesn't exist"""
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object, Bucket=self.bucket, Key=s3_key
+            )
+            return response.get('Metadata', {})
+        except ClientError as e:
+            if e.response['Error']['Code'] in ('404', 'NoSuchKey', 'NotFound'):
+                return None
+            raise
 
-        config = TransferConfig(
-            multipart_threshold=100 * 1024 * 1024,
-            max_concurrency=4,
-            multipart_chunksize=25 * 1024 * 1024
+    async def _transfer(self, file_path: str, s3_key: str, extra_args: dict,
+                        callback: Optional[Callable[[int], None]]):
+        """Queue an upload on the shared transfer manager and wait for it"""
+        subscribers = [ProgressCallbackInvoker(callback)] if callback else None
+        future = self._transfer_manager.upload(
+            file_path,
+            self.bucket,
+            s3_key,
+            extra_args=extra_args,
+            subscribers=subscribers
         )
+        # Wait in a worker thread to avoid blocking the event loop
+        await asyncio.to_thread(future.result)
 
+    def _progress_reporter(self, file_size: int, progress_callback: Optional[ProgressCallback]):
+        """
+        Build a boto3 transfer Callback that forwards byte counts to an async
+        progress callback on the event loop, at most every PROGRESS_INTERVAL
+        """
+        if progress_callback is None:
+            return None
+
+        loop = asyncio.get_running_loop()
+        lock = threading.Lock()  # boto3 calls back from several part threads
+        state = {'sent': 0, 'last_report': 0.0}
+
+        def on_bytes(bytes_amount: int):
+            with lock:
+                state['sent'] += bytes_amount
+                now = time.monotonic()
+                if now - state['last_report'] < PROGRESS_INTERVAL and state['sent'] < file_size:
+                    return
+                state['last_report'] = now
+                sent = state['sent']
+            asyncio.run_coroutine_threadsafe(progress_callback(sent, file_size), loop)
+
+        return on_bytes
+
+    async def _upload_with_retry(self, file_path: str, s3_key: str, max_retries: int,
+                                 file_size: int, progress_callback: Optional[ProgressCallback],
+                                 extra_args: dict) -> bool:
+        """Upload through the shared transfer manager, which goes multipart on its own"""
         for attempt in range(max_retries):
+            callback = self._progress_reporter(file_size, progress_callback)
             try:
-                # Run in thread pool to avoid blocking
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(
-                    None,
-                    lambda: self.s3_client.upload_file(
-                        file_path,
-                        self.bucket,
-                        s3_key,
-                        Config=config
-                    )
-                )
-                logger.info(f"Successfully uploaded {s3_key} (multipart)")
+                await self._transfer(file_path, s3_key, extra_args, callback)
+                logger.info(f"Successfully uploaded {s3_key}")
                 return True
             except ClientError as e:
-                logger.error(f"Multipart upload attempt {attempt + 1} failed: {e}")
+                logger.error(f"Upload attempt {attempt + 1} failed: {e}")
                 if attempt == max_retries - 1:
                     raise
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(2 ** attempt)  # Exponential backoff
 
         return False
 
+    def close(self):
+        """Shut down the transfer manager's threads (waits for in-flight uploads)"""
+        self._transfer_manager.shutdown()
+
     async def test_connection(self) -> bool:
         """Test AWS credentials and bucket access"""
+        verified_key = (self._client_hash, self.bucket)
+        if verified_key in S3Uploader._verified_buckets:
+            return True
+
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                self.s3_client.head_bucket,
-                Bucket=self.bucket
-            )
+            await asyncio.to_thread(self.s3_client.head_bucket, Bucket=self.bucket)
+            S3Uploader._verified_buckets.add(verified_key)
             return True
         except ClientError as e:
             error_code = e.response['Error']['Code']
@@ -117,15 +212,45 @@ class S3Uploader:
             else:
                 raise ValueError(f"AWS connection failed: {str(e)}")
 
-async def upload_to_s3(file_path: str, s3_key: str, config: Config) -> bool:
+# Uploader for the current credentials/region/bucket, reused across uploads
+_uploaders = {}
+
+def get_uploader(config: Config) -> S3Uploader:
+    """Get a cached S3Uploader for this config"""
+    key = (config.aws_access_key, config.aws_secret_key, config.s3_region, config.s3_bucket)
+    uploader = _uploaders.get(key)
+    if uploader is None:
+        # Config changed: retire the old uploader's transfer threads. Closing
+        # waits for its in-flight uploads, so do it off the caller's thread.
+        for stale in _uploaders.values():
+            threading.Thread(target=stale.close, name="s3-uploader-close", daemon=True).start()
+        _uploaders.clear()
+        uploader = _uploaders[key] = S3Uploader(config)
+    return uploader
+
+def close_uploaders():
+    """Shut down cached uploaders (app shutdown)"""
+    for uploader in _uploaders.values():
+        uploader.close()
+    _uploaders.clear()
+
+async def upload_to_s3(file_path: str, s3_key: str, config: Config,
+                       progress_callback: Optional[ProgressCallback] = None,
+                       metadata: Optional[Dict[str, str]] = None) -> bool:
     """Convenience function to upload file to S3"""
-    uploader = S3Uploader(config)
-    return await uploader.upload_file(file_path, s3_key)
+    uploader = get_uploader(config)
+    return await uploader.upload_file(file_path, s3_key, progress_callback=progress_callback,
+                                      metadata=metadata)
+
+async def s3_object_matches(s3_key: str, metadata: Dict[str, str], config: Config) -> bool:
+    """Check whether s3_key already exists and was uploaded with this metadata"""
+    existing = await get_uploader(config).object_metadata(s3_key)
+    return existing is not None and all(existing.get(k) == v for k, v in metadata.items())
 
 async def validate_aws_credentials(config: Config) -> bool:
     """Test AWS credentials before processing"""
     try:
-        uploader = S3Uploader(config)
+        uploader = get_uploader(config)
         await uploader.test_connection()
         return True
     except Exception as e:
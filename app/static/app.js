@@ -48,9 +48,6 @@ class PipelineApp {
 
         // Log management
         document.getElementById('clear-log-btn').addEventListener('click', () => this.clearLog());
-
-        // Auto-refresh games list
-        setInterval(() => this.loadGames(), 5000);
     }
 
     async loadConfig() {
@@ -401,6 +398,8 @@ class PipelineApp {
         this.websocket.onopen = () => {
             console.log('WebSocket connected');
             this.log('Real-time updates connected', 'info');
+            // Resync games list; later changes are pushed over the socket
+            this.loadGames();
         };
 
         this.websocket.onmessage = (event) => {
@@ -427,6 +426,9 @@ class PipelineApp {
 
         if (data.game_uuid && data.angle) {
             this.updateAngleProgress(data);
+        } else if (data.game_uuid) {
+            // Game-level status change
+            this.loadGames();
         }
 
         if (data.processing_active === false) {
@@ -63,7 +63,7 @@ async function scanVideos() {
     btn.textContent = 'Scanning...';
 
     try {
-        const response = await fetch(`${API_BASE}/scan`);
+        const response = await fetch(`${API_BASE}/scan?force_refresh=true`);
         const data = await response.json();
 
         scannedVideos = data.dates;
@@ -407,11 +407,22 @@ function connectWebSocket() {
     };
 }
 
+// Coalesce bursts of progress messages (several angles, several stages)
+// into a single jobs list refresh
+let loadJobsTimer = null;
+function scheduleLoadJobs() {
+    if (loadJobsTimer) return;
+    loadJobsTimer = setTimeout(() => {
+        loadJobsTimer = null;
+        loadJobs();
+    }, 250);
+}
+
 function handleProgressUpdate(message) {
     console.log('Progress update:', message);
 
     // Update jobs list
-    loadJobs();
+    scheduleLoadJobs();
 
     // Display processing status
     if (message.game_id) {
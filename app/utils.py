@@ -52,9 +52,9 @@ def validate_time_range(start: str, end: str, existing_games: List[Game] = None)
     if existing_games is None:
         existing_games = []
 
-    # Parse times
-    start_time = datetime.strptime(start, "%H:%M:%S")
-    end_time = datetime.strptime(end, "%H:%M:%S")
+    # Parse times (already format-checked by TimeRange)
+    start_time = time_to_seconds(start)
+    end_time = time_to_seconds(end)
 
     # Check if end is after start
     if end_time <= start_time:
@@ -62,8 +62,8 @@ def validate_time_range(start: str, end: str, existing_games: List[Game] = None)
 
     # Check for overlaps
     for game in existing_games:
-        game_start = datetime.strptime(game.time_range.start, "%H:%M:%S")
-        game_end = datetime.strptime(game.time_range.end, "%H:%M:%S")
+        game_start = time_to_seconds(game.time_range.start)
+        game_end = time_to_seconds(game.time_range.end)
 
         # Check overlap
         if not (end_time <= game_start or start_time >= game_end):
@@ -86,6 +86,13 @@ def cleanup_temp_files():
                 except Exception as e:
                     logger.warning(f"Could not delete {file}: {e}")
 
+def time_to_seconds(time_str: str) -> float:
+    """Convert "HH:MM:SS" (or "MM:SS" / "SS", fractions allowed) to seconds"""
+    seconds = 0.0
+    for part in time_str.split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
 def format_duration(seconds: float) -> str:
     """Format duration in seconds to HH:MM:SS"""
     hours = int(seconds // 3600)
@@ -1,25 +1,37 @@
 import subprocess
 import json
 import asyncio
+from functools import lru_cache
 from pathlib import Path
 import logging
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
+
+from .utils import time_to_seconds
 
 logger = logging.getLogger(__name__)
 
-async def extract_segment(input_file: str, output_file: str, start: str, end: str):
-    """Extract video segment using FFmpeg (fast, copy codec)"""
-    cmd = [
+def extract_segment_cmd(input_file: str, output_file: str, start: str, end: str) -> List[str]:
+    """Build the FFmpeg argv for a stream-copy cut from start to end"""
+    # -ss before -i seeks the input to the keyframe at/before start and resets
+    # output timestamps to 0, so the cut length must be given as a duration
+    duration = time_to_seconds(end) - time_to_seconds(start)
+
+    return [
         'ffmpeg',
-        '-ss', start,  # Start time
+        '-ss', start,  # Start time (input seek, lands on a keyframe)
         '-i', input_file,
-        '-to', end,    # End time
+        '-t', f"{duration:.3f}",  # Segment length
         '-c', 'copy',  # Copy codec (no re-encoding)
         '-avoid_negative_ts', 'make_zero',
+        '-movflags', '+faststart',  # moov up front: playable while streaming from S3
         output_file,
         '-y'  # Overwrite
     ]
 
+async def extract_segment(input_file: str, output_file: str, start: str, end: str):
+    """Extract video segment using FFmpeg (fast, copy codec)"""
+    cmd = extract_segment_cmd(input_file, output_file, start, end)
+
     logger.info(f"Extracting segment from {start} to {end}")
     process = await asyncio.create_subprocess_exec(
         *cmd,
@@ -56,18 +68,60 @@ def get_resolution(file_path: str) -> Tuple[Optional[int], Optional[int]]:
             logger.error(f"ffprobe failed: {result.stderr}")
             return None, None
 
-        data = json.loads(result.stdout)
-
-        for stream in data['streams']:
-            if stream['codec_type'] == 'video':
-                return stream['width'], stream['height']
+        return _parse_resolution(result.stdout)
 
+    except Exception as e:
+        logger.error(f"Error getting resolution: {e}")
         return None, None
 
+async def get_resolution_async(file_path: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Get video resolution without blocking the event loop (asyncio subprocess,
+    no executor thread parked on ffprobe)
+
+    Returns:
+        (width, height) tuple
+    """
+    cmd = [
+        'ffprobe', '-v', 'quiet',
+        '-print_format', 'json',
+        '-show_streams',
+        file_path
+    ]
+
+    try:
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        try:
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=30)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            raise RuntimeError("ffprobe timeout")
+
+        if process.returncode != 0:
+            logger.error(f"ffprobe failed: {stderr.decode()}")
+            return None, None
+
+        return _parse_resolution(stdout)
+
     except Exception as e:
         logger.error(f"Error getting resolution: {e}")
         return None, None
 
+def _parse_resolution(ffprobe_output) -> Tuple[Optional[int], Optional[int]]:
+    """Pick the first video stream's size out of ffprobe -show_streams JSON"""
+    data = json.loads(ffprobe_output)
+
+    for stream in data['streams']:
+        if stream['codec_type'] == 'video':
+            return stream['width'], stream['height']
+
+    return None, None
+
 def get_video_metadata_extended(file_path: str) -> dict:
     """
     Get extended video metadata (duration, resolution, codec, etc.)
@@ -159,6 +213,26 @@ def check_gpu_available() -> bool:
     except (subprocess.TimeoutExpired, FileNotFoundError):
         return False
 
+@lru_cache(maxsize=None)
+def gpu_encoding_available() -> bool:
+    """
+    Check once per process whether NVENC encoding can be used: an NVIDIA
+    GPU is present and this ffmpeg build ships the h264_nvenc encoder
+    """
+    if not check_gpu_available():
+        return False
+
+    try:
+        result = subprocess.run(
+            ['ffmpeg', '-hide_banner', '-encoders'],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return result.returncode == 0 and 'h264_nvenc' in result.stdout
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return False
+
 async def compress_video(input_file: str, output_file: str, use_gpu: bool = True):
     """
     Compress 4K to 1080p using GPU (if available) or CPU fallback
@@ -169,8 +243,9 @@ async def compress_video(input_file: str, output_file: str, use_gpu: bool = True
         use_gpu: Whether to attempt GPU encoding
     """
 
-    # Try GPU encoding first if available
-    if use_gpu and check_gpu_available():
+    # Try GPU encoding first if available (the first probe runs nvidia-smi
+    # and ffmpeg -encoders, so keep it off the event loop)
+    if use_gpu and await asyncio.to_thread(gpu_encoding_available):
         logger.info("Using NVIDIA GPU hardware encoding")
         success = await _compress_with_gpu(input_file, output_file)
         if success:
@@ -188,6 +263,7 @@ async def _compress_with_gpu(input_file: str, output_file: str) -> bool:
         cmd = [
             'ffmpeg',
             '-hwaccel', 'cuda',
+            '-hwaccel_output_format', 'cuda',  # Keep decoded frames in GPU memory for scale_cuda/nvenc
             '-i', input_file,
             '-vf', 'scale_cuda=1920:1080',
             '-c:v', 'h264_nvenc',
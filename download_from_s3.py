@@ -5,13 +5,16 @@ Downloads all files from S3 to local input directory
 """
 
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, EndpointConnectionError
 import os
 from pathlib import Path
 import time
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 from tqdm import tqdm
-import hashlib
 
 # Load environment variables
 load_dotenv()
@@ -23,15 +26,36 @@ LOCAL_DIR = "input"
 MAX_RETRIES = 10  # More retries for unstable connection
 CHUNK_SIZE = 8 * 1024 * 1024  # 8MB chunks for better resume capability
 RETRY_DELAY = 2  # Initial delay in seconds (exponential backoff)
+MAX_PARALLEL_DOWNLOADS = 4  # Files downloaded concurrently (network-bound, GIL released)
 
 # Initialize S3 client
 s3_client = boto3.client(
     's3',
     aws_access_key_id=os.getenv('AWS_ACCESS_KEY_ID'),
     aws_secret_access_key=os.getenv('AWS_SECRET_ACCESS_KEY'),
-    region_name=os.getenv('AWS_S3_REGION', 'us-east-1')
+    region_name=os.getenv('AWS_S3_REGION', 'us-east-1'),
+    config=Config(
+        # Default 3 attempts; the download loop below does its own retries
+        retries={'mode': 'standard'},
+        max_pool_connections=32,
+        tcp_keepalive=True
+    )
 )
 
+# One tqdm row per download worker so concurrent bars don't overwrite each other
+_progress_rows = itertools.count()
+_worker_state = threading.local()
+
+def progress_position():
+    """Stable progress bar row for the current download worker thread"""
+    if not hasattr(_worker_state, 'position'):
+        _worker_state.position = next(_progress_rows)
+    return _worker_state.position
+
+# Set on Ctrl-C (which only reaches the main thread) so in-flight workers
+# stop streaming and keep their partial files for the next run to resume
+_stop_event = threading.Event()
+
 def format_bytes(bytes_size):
     """Format bytes to human readable"""
     for unit in ['B', 'KB', 'MB', 'GB']:
@@ -83,7 +107,7 @@ def check_file_exists(local_path, expected_size):
         return False, local_size  # Partial download
     else:
         # Local file is larger (corrupted?)
-        print(f"  ⚠️  Local file larger than expected, re-downloading")
+        tqdm.write(f"  ⚠️  Local file larger than expected, re-downloading")
         os.remove(local_path)
         return False, 0
 
@@ -94,18 +118,19 @@ def download_file_with_resume(bucket, s3_key, local_path, expected_size, file_nu
     # Get filename for display
     filename = os.path.basename(s3_key)
 
-    print(f"\n[{file_num}/{total_files}] {filename}")
-    print(f"  Size: {format_bytes(expected_size)}")
+    # Workers share the terminal with the positioned progress bars, so all
+    # their output goes through tqdm.write, one call per message
+    tqdm.write(f"\n[{file_num}/{total_files}] {filename}\n  Size: {format_bytes(expected_size)}")
 
     # Check if already downloaded
     exists, local_size = check_file_exists(local_path, expected_size)
 
     if exists:
-        print(f"  ✓ Already downloaded, skipping")
+        tqdm.write(f"  ✓ Already downloaded, skipping")
         return True
 
     if local_size > 0:
-        print(f"  ⚠️  Resuming from {format_bytes(local_size)} ({(local_size/expected_size*100):.1f}%)")
+        tqdm.write(f"  ⚠️  Resuming from {format_bytes(local_size)} ({(local_size/expected_size*100):.1f}%)")
 
     # Create parent directory
     os.makedirs(os.path.dirname(local_path), exist_ok=True)
@@ -113,11 +138,14 @@ def download_file_with_resume(bucket, s3_key, local_path, expected_size, file_nu
     # Download with retries
     for attempt in range(MAX_RETRIES):
         try:
+            if _stop_event.is_set():
+                raise KeyboardInterrupt
+
             # Check current file size for resume
             exists, local_size = check_file_exists(local_path, expected_size)
 
             if exists:
-                print(f"  ✓ Download complete!")
+                tqdm.write(f"  ✓ Download complete!")
                 return True
 
             # Prepare range for resume
@@ -147,8 +175,10 @@ def download_file_with_resume(bucket, s3_key, local_path, expected_size, file_nu
 
             # Progress bar
             with open(local_path, mode) as f:
-                with tqdm(total=expected_size, initial=local_size, unit='B', unit_scale=True, desc=f"  Downloading") as pbar:
+                with tqdm(total=expected_size, initial=local_size, unit='B', unit_scale=True, desc=f"  {filename}", position=progress_position(), leave=False) as pbar:
                     for chunk in response['Body'].iter_chunks(chunk_size=CHUNK_SIZE):
+                        if _stop_event.is_set():
+                            raise KeyboardInterrupt
                         if chunk:
                             f.write(chunk)
                             pbar.update(len(chunk))
@@ -156,34 +186,36 @@ def download_file_with_resume(bucket, s3_key, local_path, expected_size, file_nu
             # Verify size
             final_size = os.path.getsize(local_path)
             if final_size == expected_size:
-                print(f"  ✓ Download complete! ({format_bytes(final_size)})")
+                tqdm.write(f"  ✓ Download complete! ({format_bytes(final_size)})")
                 return True
             else:
-                print(f"  ⚠️  Size mismatch: {final_size} vs {expected_size}, retrying...")
+                tqdm.write(f"  ⚠️  Size mismatch: {final_size} vs {expected_size}, retrying...")
 
         except (ClientError, EndpointConnectionError, ConnectionError, TimeoutError) as e:
             if attempt < MAX_RETRIES - 1:
                 delay = RETRY_DELAY * (2 ** attempt)  # Exponential backoff
-                print(f"  ⚠️  Connection error (attempt {attempt + 1}/{MAX_RETRIES}): {e}")
-                print(f"  ⏳ Retrying in {delay} seconds...")
-                time.sleep(delay)
+                tqdm.write(f"  ⚠️  Connection error (attempt {attempt + 1}/{MAX_RETRIES}): {e}\n"
+                           f"  ⏳ Retrying in {delay} seconds...")
+                _stop_event.wait(delay)  # Cut short by Ctrl-C
             else:
-                print(f"  ❌ Failed after {MAX_RETRIES} attempts: {e}")
+                tqdm.write(f"  ❌ Failed after {MAX_RETRIES} attempts: {e}")
                 return False
 
         except KeyboardInterrupt:
-            print(f"\n⚠️  Download interrupted by user")
-            print(f"  Progress saved: {format_bytes(os.path.getsize(local_path) if os.path.exists(local_path) else 0)}")
-            print(f"  Run script again to resume from this point")
+            saved = os.path.getsize(local_path) if os.path.exists(local_path) else 0
+            tqdm.write(f"\n⚠️  Download of {filename} interrupted by user\n"
+                       f"  Progress saved: {format_bytes(saved)}\n"
+                       f"  Run script again to resume from this point")
             raise
 
         except Exception as e:
-            print(f"  ❌ Unexpected error: {e}")
             if attempt < MAX_RETRIES - 1:
                 delay = RETRY_DELAY * (2 ** attempt)
-                print(f"  ⏳ Retrying in {delay} seconds...")
-                time.sleep(delay)
+                tqdm.write(f"  ❌ Unexpected error: {e}\n"
+                           f"  ⏳ Retrying in {delay} seconds...")
+                _stop_event.wait(delay)  # Cut short by Ctrl-C
             else:
+                tqdm.write(f"  ❌ Unexpected error: {e}")
                 return False
 
     return False
@@ -214,28 +246,44 @@ def main():
 
     start_time = time.time()
 
-    for idx, file_info in enumerate(files, 1):
-        s3_key = file_info['key']
-        size = file_info['size']
+    # Download files concurrently; each worker handles its own retries
+    executor = ThreadPoolExecutor(max_workers=MAX_PARALLEL_DOWNLOADS)
+    futures = {}
 
-        # Get relative path (remove prefix)
-        relative_path = s3_key.replace(S3_PREFIX, '')
-        local_path = os.path.join(LOCAL_DIR, relative_path)
+    try:
+        for idx, file_info in enumerate(files, 1):
+            s3_key = file_info['key']
+            size = file_info['size']
+
+            # Get relative path (remove prefix)
+            relative_path = s3_key.replace(S3_PREFIX, '')
+            local_path = os.path.join(LOCAL_DIR, relative_path)
+
+            future = executor.submit(
+                download_file_with_resume,
+                S3_BUCKET,
+                s3_key,
+                local_path,
+                size,
+                idx,
+                total_files
+            )
+            futures[future] = relative_path
+
+        for future in as_completed(futures):
+            if future.result():
+                successful += 1
+            else:
+                failed.append(futures[future])
+
+    except KeyboardInterrupt:
+        # Drop queued downloads and stop the running ones instead of
+        # waiting for every file to finish
+        _stop_event.set()
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
 
-        # Download
-        success = download_file_with_resume(
-            S3_BUCKET,
-            s3_key,
-            local_path,
-            size,
-            idx,
-            total_files
-        )
-
-        if success:
-            successful += 1
-        else:
-            failed.append(relative_path)
+    executor.shutdown()
 
     # Summary
     elapsed = time.time() - start_time
@@ -1,13 +1,25 @@
 import ezdxf
-import json
+import mmap
+import orjson
+import os
 import re
 from datetime import datetime
 import math
+import numpy as np
+
+# Log line, matched directly against the mmapped bytes; the millisecond
+# part is captured separately so the date/time prefix can be memoized
+_LOG_PATTERN = re.compile(rb'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\.(\d{3}) \| Tag (\d+) \| X=(\d+) \| Y=(\d+) \| Timestamp=(\d+)')
+
+# Epoch seconds for each whole-second date/time prefix seen in the logs
+_EPOCH_CACHE = {}
 
 def parse_dxf(dxf_path):
     """
     Parses the DXF file to extract court geometry.
-    Returns a list of lines and arcs.
+    Returns a list of lines and arcs, plus packed numpy arrays of line
+    endpoints (N, 4: sx, sy, ex, ey) and circle/arc extents (M, 3: cx, cy, r)
+    used for the bounding-box pass.
     """
     try:
         doc = ezdxf.readfile(dxf_path)
@@ -35,7 +47,7 @@ def parse_dxf(dxf_path):
                     'layer': polyline.dxf.layer
                 })
             # Close loop if closed
-            if polyline.is_closed:
+            if polyline.is_closed and points:
                  geometry.append({
                     'type': 'line',
                     'start': {'x': points[-1].x, 'y': points[-1].y},
@@ -62,56 +74,68 @@ def parse_dxf(dxf_path):
                 'end_angle': arc.dxf.end_angle,
                 'layer': arc.dxf.layer
             })
-            
-        return geometry
+
+        lines = np.array(
+            [(g['start']['x'], g['start']['y'], g['end']['x'], g['end']['y'])
+             for g in geometry if g['type'] == 'line'],
+            dtype=float
+        ).reshape(-1, 4)
+        arcs = np.array(
+            [(g['center']['x'], g['center']['y'], g['radius'])
+             for g in geometry if g['type'] in ('circle', 'arc')],
+            dtype=float
+        ).reshape(-1, 3)
+
+        return geometry, lines, arcs
     except Exception as e:
         print(f"Error parsing DXF: {e}")
-        return []
+        return [], np.empty((0, 4)), np.empty((0, 3))
 
 def parse_logs(log_path):
     """
     Parses the log file and resamples data to fixed 30 FPS (33.33ms).
-    Returns a dictionary of frame indices to tag positions.
+    Returns a dictionary with the list of tag ids and a
+    (total_frames, n_tags, 2) array of interpolated x/y positions, where
+    NaN marks frames outside a tag's recorded range.
     """
+    empty = {'tag_ids': [], 'coords': np.empty((0, 0, 2))}
     raw_data = {}
-    
-    # Regex to parse log line
-    pattern = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\.\d{3}) \| Tag (\d+) \| X=(\d+) \| Y=(\d+) \| Timestamp=(\d+)')
+
+    # Global start and end time, tracked while reading
+    start_time = float('inf')
+    end_time = float('-inf')
     
     print("Reading raw logs...")
     try:
-        with open(log_path, 'r') as f:
-            for line in f:
-                match = pattern.search(line)
-                if match:
-                    dt_str, tag_id, x, y, ts = match.groups()
-                    
-                    # Parse datetime to timestamp (seconds)
-                    dt = datetime.strptime(dt_str, '%Y-%m-%d %H:%M:%S.%f')
-                    timestamp = dt.timestamp()
-                    
-                    if tag_id not in raw_data:
-                        raw_data[tag_id] = []
-                    
-                    raw_data[tag_id].append({
-                        'ts': timestamp,
-                        'x': int(x),
-                        'y': int(y)
-                    })
+        if os.path.getsize(log_path) == 0:
+            return empty
+
+        with open(log_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for match in _LOG_PATTERN.finditer(mm):
+                dt_str, millis, tag_id, x, y, ts = match.groups()
+
+                # Parse datetime to timestamp (seconds), strptime once per second
+                epoch = _EPOCH_CACHE.get(dt_str)
+                if epoch is None:
+                    epoch = datetime.strptime(dt_str.decode(), '%Y-%m-%d %H:%M:%S').timestamp()
+                    _EPOCH_CACHE[dt_str] = epoch
+                timestamp = epoch + int(millis) / 1000
+                start_time = min(start_time, timestamp)
+                end_time = max(end_time, timestamp)
+                
+                if tag_id not in raw_data:
+                    raw_data[tag_id] = []
+                
+                raw_data[tag_id].append((timestamp, int(x), int(y)))
     except Exception as e:
         print(f"Error parsing logs: {e}")
-        return {}
+        return empty
 
     print("Resampling to 30 FPS...")
-    resampled_data = {}
     
-    # Find global start and end time
-    all_timestamps = [p['ts'] for tag_points in raw_data.values() for p in tag_points]
-    if not all_timestamps:
-        return {}
+    if not raw_data:
+        return empty
         
-    start_time = min(all_timestamps)
-    end_time = max(all_timestamps)
     duration = end_time - start_time
     
     # 30 FPS = 1/30 seconds per frame
@@ -119,75 +143,27 @@ def parse_logs(log_path):
     total_frames = int(duration / FRAME_DURATION)
     
     print(f"Duration: {duration:.2f}s, Total Frames: {total_frames}")
-    
-    for frame_idx in range(total_frames):
-        current_time = start_time + (frame_idx * FRAME_DURATION)
-        frame_key = f"frame_{frame_idx}"
-        resampled_data[frame_key] = []
-        
-        for tag_id, points in raw_data.items():
-            # Find points surrounding current_time
-            # This assumes points are sorted by timestamp (which they are from log read)
-            
-            # Optimization: We could track index per tag, but for now simple search
-            # Binary search would be better, but linear scan from last known index is best for sequential access.
-            # Let's just do a simple linear search for now, assuming not too many points per tag?
-            # Actually, points list can be huge. Let's use bisect or just smart indexing.
-            
-            # Simple approach: Filter points within a small window? No, we need interpolation.
-            # Let's use numpy-style interpolation logic but in pure python for simplicity if possible.
-            
-            # Find the first point > current_time
-            # We can optimize this by remembering the last index used for this tag.
-            # But `points` is list of dicts.
-            
-            # Let's just iterate through points and find the interval.
-            # Since we iterate frames sequentially, we can keep a pointer for each tag.
-            if not hasattr(parse_logs, 'tag_pointers'):
-                parse_logs.tag_pointers = {t: 0 for t in raw_data.keys()}
-            
-            idx = parse_logs.tag_pointers[tag_id]
-            
-            # Advance pointer until we find the interval or run out
-            while idx < len(points) - 1 and points[idx+1]['ts'] < current_time:
-                idx += 1
-            
-            parse_logs.tag_pointers[tag_id] = idx
-            
-            if idx >= len(points) - 1:
-                # End of data for this tag
-                continue
-                
-            p1 = points[idx]
-            p2 = points[idx+1]
-            
-            # Check if current_time is within [p1, p2]
-            if p1['ts'] <= current_time <= p2['ts']:
-                # Interpolate
-                t_diff = p2['ts'] - p1['ts']
-                if t_diff > 0:
-                    ratio = (current_time - p1['ts']) / t_diff
-                    
-                    # Linear interpolation
-                    new_x = p1['x'] + (p2['x'] - p1['x']) * ratio
-                    new_y = p1['y'] + (p2['y'] - p1['y']) * ratio
-                    
-                    resampled_data[frame_key].append({
-                        'tag_id': tag_id,
-                        'x': new_x,
-                        'y': new_y
-                    })
-            elif current_time < p1['ts']:
-                # Before first point (shouldn't happen with sequential scan but safe to handle)
-                pass
-            else:
-                # After last point
-                pass
-
-    # Reset pointers for next run if needed (though we re-init raw_data locally)
-    parse_logs.tag_pointers = {}
-    
-    return resampled_data
+
+    frame_times = start_time + np.arange(total_frames) * FRAME_DURATION
+    tag_ids = [tag_id.decode() for tag_id in raw_data]
+    coords = np.full((total_frames, len(tag_ids), 2), np.nan)
+
+    for ti, tag_points in enumerate(raw_data.values()):
+        # Points are sorted by timestamp (which they are from log read)
+        points = np.array(tag_points, dtype=float)
+        if len(points) < 2:
+            continue
+
+        ts = points[:, 0]
+        # Only frames inside this tag's [first, last] sample get a position
+        in_range = (frame_times >= ts[0]) & (frame_times <= ts[-1])
+        coords[in_range, ti, 0] = np.interp(frame_times[in_range], ts, points[:, 1])
+        coords[in_range, ti, 1] = np.interp(frame_times[in_range], ts, points[:, 2])
+
+    # Positions are whole millimetres; 2 decimals keeps the JSON output small
+    np.round(coords, 2, out=coords)
+
+    return {'tag_ids': tag_ids, 'coords': coords}
 
 def main():
     dxf_path = 'court_2.dxf'
@@ -195,7 +171,7 @@ def main():
     output_path = 'app/static/game_data.json'
     
     print("Parsing DXF...")
-    court_geometry = parse_dxf(dxf_path)
+    court_geometry, court_lines, court_arcs = parse_dxf(dxf_path)
     
     print("Parsing Logs...")
     log_data = parse_logs(log_path)
@@ -203,39 +179,38 @@ def main():
     # Calculate bounding box for logs to help with auto-scaling
     min_x, max_x = float('inf'), float('-inf')
     min_y, max_y = float('inf'), float('-inf')
-    
-    for frame in log_data.values():
-        for tag in frame:
-            min_x = min(min_x, tag['x'])
-            max_x = max(max_x, tag['x'])
-            min_y = min(min_y, tag['y'])
-            max_y = max(max_y, tag['y'])
+
+    log_coords = log_data['coords']
+    positions = log_coords[~np.isnan(log_coords[..., 0])]
+    if len(positions):
+        min_x, min_y = positions.min(axis=0)
+        max_x, max_y = positions.max(axis=0)
             
     log_bounds = {
-        'min_x': min_x, 'max_x': max_x,
-        'min_y': min_y, 'max_y': max_y
+        'min_x': float(min_x), 'max_x': float(max_x),
+        'min_y': float(min_y), 'max_y': float(max_y)
     }
     
     # Calculate bounding box for court
+    # Simple bounding box for lines/arcs (ignoring arc curvature for simplicity of initial view)
     c_min_x, c_max_x = float('inf'), float('-inf')
     c_min_y, c_max_y = float('inf'), float('-inf')
-    
-    # Simple bounding box for lines/arcs (ignoring arc curvature for simplicity of initial view)
-    for item in court_geometry:
-        if item['type'] == 'line':
-            c_min_x = min(c_min_x, item['start']['x'], item['end']['x'])
-            c_max_x = max(c_max_x, item['start']['x'], item['end']['x'])
-            c_min_y = min(c_min_y, item['start']['y'], item['end']['y'])
-            c_max_y = max(c_max_y, item['start']['y'], item['end']['y'])
-        elif item['type'] in ['circle', 'arc']:
-             c_min_x = min(c_min_x, item['center']['x'] - item['radius'])
-             c_max_x = max(c_max_x, item['center']['x'] + item['radius'])
-             c_min_y = min(c_min_y, item['center']['y'] - item['radius'])
-             c_max_y = max(c_max_y, item['center']['y'] + item['radius'])
+
+    if len(court_lines):
+        c_min_x = min(c_min_x, court_lines[:, ::2].min())
+        c_max_x = max(c_max_x, court_lines[:, ::2].max())
+        c_min_y = min(c_min_y, court_lines[:, 1::2].min())
+        c_max_y = max(c_max_y, court_lines[:, 1::2].max())
+
+    if len(court_arcs):
+        c_min_x = min(c_min_x, (court_arcs[:, 0] - court_arcs[:, 2]).min())
+        c_max_x = max(c_max_x, (court_arcs[:, 0] + court_arcs[:, 2]).max())
+        c_min_y = min(c_min_y, (court_arcs[:, 1] - court_arcs[:, 2]).min())
+        c_max_y = max(c_max_y, (court_arcs[:, 1] + court_arcs[:, 2]).max())
 
     court_bounds = {
-        'min_x': c_min_x, 'max_x': c_max_x,
-        'min_y': c_min_y, 'max_y': c_max_y
+        'min_x': float(c_min_x), 'max_x': float(c_max_x),
+        'min_y': float(c_min_y), 'max_y': float(c_max_y)
     }
 
     output = {
@@ -246,8 +221,8 @@ def main():
     }
     
     print(f"Writing to {output_path}...")
-    with open(output_path, 'w') as f:
-        json.dump(output, f)
+    with open(output_path, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS))
         
     print("Done.")
 
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from app.parallel_processor import GameJob
+
+
+class TestUploadMetadata(unittest.TestCase):
+    def _job(self, filename):
+        tmpdir = tempfile.mkdtemp()
+        path = os.path.join(tmpdir, filename)
+        with open(path, 'wb') as f:
+            f.write(b'\0' * 16)
+        self.addCleanup(os.rmdir, tmpdir)
+        self.addCleanup(os.remove, path)
+        job = GameJob('10-02', 1, '10:00:00', '11:00:00', {'farright': path})
+        return job, path
+
+    def test_non_ascii_filename(self):
+        job, path = self._job('10-2 FR_café.mp4')
+        metadata = job.upload_metadata(path)
+        for value in metadata.values():
+            self.assertTrue(value.isascii(), value)
+        self.assertTrue(metadata['source'].startswith('10-2%20FR_caf%C3%A9.mp4:16:'))
+
+    def test_source_changes_with_file(self):
+        job, path = self._job('10-2 FR.mp4')
+        before = job.upload_metadata(path)['source']
+        with open(path, 'ab') as f:
+            f.write(b'\0')
+        self.assertNotEqual(job.upload_metadata(path)['source'], before)
+        self.assertEqual(job.upload_metadata(path)['cut'], '10:00:00-11:00:00')
+
+
+if __name__ == '__main__':
+    unittest.main()
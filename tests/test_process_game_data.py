@@ -0,0 +1,62 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import orjson
+from process_game_data import parse_logs
+
+LOG_LINES = [
+    "2025-11-22 10:00:00.000 | Tag 1 | X=0 | Y=1000 | Timestamp=1",
+    "2025-11-22 10:00:00.500 | Tag 2 | X=500 | Y=500 | Timestamp=2",
+    "2025-11-22 10:00:01.000 | Tag 1 | X=300 | Y=1300 | Timestamp=3",
+    "garbage line that does not match",
+    "2025-11-22 10:00:01.000 | Tag 2 | X=800 | Y=200 | Timestamp=4",
+]
+
+class TestParseLogs(unittest.TestCase):
+    def _parse(self, text):
+        with tempfile.NamedTemporaryFile('w', suffix='.log', delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+        return parse_logs(f.name)
+
+    def test_coords_shape(self):
+        result = self._parse("\n".join(LOG_LINES) + "\n")
+        self.assertEqual(result['tag_ids'], ['1', '2'])
+        # 1 s of data at 30 FPS, (frames, tags, x/y)
+        self.assertEqual(result['coords'].shape, (30, 2, 2))
+
+    def test_nan_outside_tag_range(self):
+        coords = self._parse("\n".join(LOG_LINES))['coords']
+        # Tag 2 starts at 0.5 s (frame 15)
+        self.assertTrue(np.isnan(coords[:15, 1]).all())
+        self.assertFalse(np.isnan(coords[15:, 1]).any())
+        self.assertFalse(np.isnan(coords[:, 0]).any())
+
+    def test_interpolated_values(self):
+        coords = self._parse("\n".join(LOG_LINES))['coords']
+        np.testing.assert_allclose(coords[0, 0], [0, 1000])
+        np.testing.assert_allclose(coords[15, 0], [150, 1150])  # Halfway through tag 1
+        np.testing.assert_allclose(coords[3, 0], [30, 1030])
+        np.testing.assert_allclose(coords[15, 1], [500, 500])
+        np.testing.assert_allclose(coords[24, 1], [680, 320])  # 0.8 s: 60% through tag 2
+
+    def test_empty_file(self):
+        result = self._parse("")
+        self.assertEqual(result['tag_ids'], [])
+        self.assertEqual(result['coords'].shape, (0, 0, 2))
+
+    def test_no_matching_lines(self):
+        result = self._parse("nothing to see here\nstill nothing\n")
+        self.assertEqual(result['tag_ids'], [])
+        self.assertEqual(result['coords'].shape, (0, 0, 2))
+
+    def test_json_output_nan_is_null(self):
+        result = self._parse("\n".join(LOG_LINES))
+        data = orjson.loads(orjson.dumps(result, option=orjson.OPT_SERIALIZE_NUMPY))
+        self.assertEqual(data['tag_ids'], ['1', '2'])
+        self.assertEqual(data['coords'][0][1], [None, None])
+        self.assertEqual(data['coords'][15][0], [150.0, 1150.0])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
 import os
 import json
+import tempfile
 from pathlib import Path
+from unittest import mock
 from app.config import load_config, get_project_root, CONFIG_FILE
 from app.models import Config
 
@@ -24,21 +26,14 @@ class TestProductionConfig(unittest.TestCase):
 
     def test_directory_creation(self):
         """Test that critical directories are created on config load"""
-        # Remove directories to test creation
-        root = get_project_root()
-        for d in ["logs", "temp", "input", "offsets"]:
-            path = root / d
-            if path.exists():
-                # Only remove if empty to be safe, otherwise skip
-                try:
-                    os.rmdir(path)
-                except OSError:
-                    pass
-                    
-        load_config()
-        
-        for d in ["logs", "temp", "input", "offsets"]:
-            self.assertTrue((root / d).exists(), f"Directory {d} was not created")
+        # Point the project root at an empty directory to test creation
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            with mock.patch('app.config.get_project_root', return_value=root):
+                load_config()
+
+            for d in ["logs", "temp", "input", "offsets"]:
+                self.assertTrue((root / d).exists(), f"Directory {d} was not created")
 
     def test_env_override(self):
         """Test that environment variables override config file"""
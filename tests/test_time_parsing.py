@@ -0,0 +1,50 @@
+import unittest
+from datetime import datetime
+from pydantic import ValidationError
+from app.models import TIME_PATTERN, TimeRange
+from app.utils import time_to_seconds
+
+class TestTimePattern(unittest.TestCase):
+    def test_valid_times(self):
+        for value in ["00:00:00", "10:00:00", "23:59:59", "1:2:3", "09:05:07"]:
+            self.assertIsNotNone(TIME_PATTERN.fullmatch(value), value)
+
+    def test_invalid_times(self):
+        for value in ["24:00:00", "10:60:00", "10:00:60", "10:00", "100:00:00",
+                      "10:00:00\n", " 10:00:00", "10-00-00", "", "ab:cd:ef"]:
+            self.assertIsNone(TIME_PATTERN.fullmatch(value), repr(value))
+
+    def test_matches_strptime(self):
+        """The pattern accepts exactly what strptime's %H:%M:%S accepted"""
+        for value in ["00:00:00", "23:59:59", "1:2:3", "24:00:00", "10:60:00", "10:00:00\n"]:
+            try:
+                datetime.strptime(value, "%H:%M:%S")
+                accepted = True
+            except ValueError:
+                accepted = False
+            self.assertEqual(TIME_PATTERN.fullmatch(value) is not None, accepted, repr(value))
+
+    def test_time_range_validator(self):
+        self.assertEqual(TimeRange(start="1:2:3", end="23:59:59").start, "1:2:3")
+        for value in ["24:00:00", "10:00:00\n"]:
+            with self.assertRaises(ValidationError):
+                TimeRange(start=value, end="23:59:59")
+
+class TestTimeToSeconds(unittest.TestCase):
+    def test_hh_mm_ss(self):
+        self.assertEqual(time_to_seconds("00:00:00"), 0)
+        self.assertEqual(time_to_seconds("00:15:30"), 930)
+        self.assertEqual(time_to_seconds("23:59:59"), 86399)
+        self.assertEqual(time_to_seconds("1:2:3"), 3723)
+
+    def test_shorter_forms_and_fractions(self):
+        self.assertEqual(time_to_seconds("15:30"), 930)
+        self.assertEqual(time_to_seconds("42"), 42)
+        self.assertEqual(time_to_seconds("00:00:01.5"), 1.5)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            time_to_seconds("ab:cd:ef")
+
+if __name__ == '__main__':
+    unittest.main()
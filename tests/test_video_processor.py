@@ -0,0 +1,25 @@
+import unittest
+from app.video_processor import extract_segment_cmd
+
+class TestExtractSegmentCmd(unittest.TestCase):
+    def setUp(self):
+        self.cmd = extract_segment_cmd("in.mp4", "out.mp4", "00:15:30", "00:58:45")
+
+    def test_input_seek(self):
+        """-ss must come before -i (fast keyframe seek on the input)"""
+        ss = self.cmd.index('-ss')
+        self.assertEqual(self.cmd[ss + 1], "00:15:30")
+        self.assertLess(ss, self.cmd.index('-i'))
+        self.assertEqual(self.cmd[self.cmd.index('-i') + 1], "in.mp4")
+
+    def test_duration_not_end_time(self):
+        """After an input seek output timestamps start at 0: cut by end - start (43:15)"""
+        self.assertNotIn('-to', self.cmd)
+        self.assertEqual(self.cmd[self.cmd.index('-t') + 1], "2595.000")
+
+    def test_stream_copy(self):
+        self.assertEqual(self.cmd[self.cmd.index('-c') + 1], "copy")
+        self.assertIn("out.mp4", self.cmd)
+
+if __name__ == '__main__':
+    unittest.main()